@@ -774,12 +774,10 @@ FooterKey .footer-key--key {
                     entry["duration"] = now - entry["start_time"]
         try:
             from crewai.events.listeners.tracing.trace_listener import (
-                TraceCollectionListener,
+                get_current_trace_listener,
             )
 
-            listener: TraceCollectionListener | None = getattr(
-                TraceCollectionListener, "_instance", None
-            )
+            listener = get_current_trace_listener()
             if listener and listener.batch_manager:
                 bm = listener.batch_manager
                 self._trace_url = (
@@ -1055,15 +1053,13 @@ FooterKey .footer-key--key {
             set_suppress_tracing_messages(True)
 
             from crewai.events.listeners.tracing.trace_listener import (
-                TraceCollectionListener,
+                get_current_trace_listener,
             )
             from crewai.events.listeners.tracing.utils import (
                 mark_first_execution_completed,
             )
 
-            listener: TraceCollectionListener | None = getattr(
-                TraceCollectionListener, "_instance", None
-            )
+            listener = get_current_trace_listener()
             if not listener:
                 self.call_from_thread(self._dismiss_consent_modal)
                 return
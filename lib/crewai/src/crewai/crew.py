@@ -75,9 +75,6 @@ from crewai.crews.utils import (
 )
 from crewai.events.event_bus import crewai_event_bus
 from crewai.events.event_listener import EventListener
-from crewai.events.listeners.tracing.trace_listener import (
-    TraceCollectionListener,
-)
 from crewai.events.listeners.tracing.utils import (
     set_tracing_enabled,
     should_enable_tracing,
@@ -632,7 +629,9 @@ class Crew(FlowTrackable, BaseModel):
         set_tracing_enabled(tracing_enabled)
 
         # Always setup trace listener - actual execution control is via contextvar
-        trace_listener = TraceCollectionListener()
+        from crewai.events.listeners.tracing.trace_listener import get_trace_listener
+
+        trace_listener = get_trace_listener()
         trace_listener.setup_listeners(crewai_event_bus)
         event_listener.verbose = self.verbose
         event_listener.formatter.verbose = self.verbose
@@ -6,7 +6,6 @@ from typing import TYPE_CHECKING, Any
 from pydantic import Field, PrivateAttr
 
 from crewai.events.base_event_listener import BaseEventListener
-from crewai.events.listeners.tracing.trace_listener import TraceCollectionListener
 from crewai.events.types.a2a_events import (
     A2AConversationCompletedEvent,
     A2AConversationStartedEvent,
@@ -158,9 +157,6 @@ class EventListener(BaseEventListener):
             self._initialized = True
             self.formatter = ConsoleFormatter(verbose=True)
 
-            trace_listener = TraceCollectionListener()
-            trace_listener.formatter = self.formatter
-
     def setup_listeners(self, crewai_event_bus: CrewAIEventsBus) -> None:
         @crewai_event_bus.on(CCEnvEvent)
         def on_cc_env(_: Any, event: CCEnvEvent) -> None:
@@ -1,3 +1,5 @@
+from collections.abc import Iterator
+from contextlib import contextmanager
 from dataclasses import dataclass, field
 from datetime import datetime, timezone
 from logging import getLogger
@@ -244,17 +246,22 @@ class TraceBatchManager:
         else:
             self.plus_api.mark_trace_batch_as_failed(trace_batch_id, error_message)
 
-    def begin_event_processing(self) -> None:
-        """Mark that an event handler started processing (for synchronization)."""
+    @contextmanager
+    def processing(self) -> Iterator[None]:
+        """Count an event handler as pending while it builds and buffers its event.
+
+        ``finalize_batch`` waits for the count to drop to zero, so an event still
+        being serialized is not lost when the batch is sent.
+        """
         with self._pending_events_lock:
             self._pending_events_count += 1
-
-    def end_event_processing(self) -> None:
-        """Mark that an event handler finished processing (for synchronization)."""
-        with self._pending_events_cv:
-            self._pending_events_count -= 1
-            if self._pending_events_count == 0:
-                self._pending_events_cv.notify_all()
+        try:
+            yield
+        finally:
+            with self._pending_events_cv:
+                self._pending_events_count -= 1
+                if self._pending_events_count == 0:
+                    self._pending_events_cv.notify_all()
 
     def wait_for_pending_events(self, timeout: float = 2.0) -> bool:
         """Wait for all pending event handlers to finish processing
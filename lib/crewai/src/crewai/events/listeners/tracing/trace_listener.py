@@ -1,16 +1,19 @@
 """Trace collection listener for orchestrating trace collection."""
 
+from collections.abc import Callable
 from datetime import datetime, timezone
+from functools import partial
 import os
-from typing import Any, ClassVar
+import threading
+import time
+from typing import Any, ClassVar, Literal
 import uuid
 
-from typing_extensions import Self
-
 from crewai.auth.token import AuthError, get_auth_token
 from crewai.events.base_event_listener import BaseEventListener
 from crewai.events.base_events import BaseEvent
 from crewai.events.event_bus import CrewAIEventsBus
+from crewai.events.event_listener import EventListener
 from crewai.events.listeners.tracing.first_time_trace_handler import (
     FirstTimeTraceHandler,
 )
@@ -65,7 +68,6 @@ from crewai.events.types.crew_events import (
 from crewai.events.types.flow_events import (
     ConversationMessageAddedEvent,
     ConversationRouteSelectedEvent,
-    FlowCreatedEvent,
     FlowFailedEvent,
     FlowFinishedEvent,
     FlowPlotEvent,
@@ -137,27 +139,160 @@ from crewai.events.utils.console_formatter import ConsoleFormatter
 from crewai.version import get_crewai_version
 
 
+_AUTH_CACHE_TTL_SECONDS = 300.0
+
+EventHandlerKind = Literal["trace", "action"]
+
+# Events that only need to be forwarded to the generic trace/action handler,
+# keyed by event class. Events with side effects beyond collection (batch
+# ownership, finalization, console output) keep explicit handlers below.
+_FLOW_EVENT_TABLE: dict[type[BaseEvent], tuple[str, EventHandlerKind]] = {
+    MethodExecutionStartedEvent: ("method_execution_started", "trace"),
+    MethodExecutionFinishedEvent: ("method_execution_finished", "trace"),
+    MethodExecutionFailedEvent: ("method_execution_failed", "trace"),
+    ConversationMessageAddedEvent: ("conversation_message_added", "action"),
+    ConversationRouteSelectedEvent: ("conversation_route_selected", "action"),
+    FlowFinishedEvent: ("flow_finished", "trace"),
+    FlowFailedEvent: ("flow_failed", "trace"),
+    FlowPlotEvent: ("flow_plot", "action"),
+}
+
+_CONTEXT_EVENT_TABLE: dict[type[BaseEvent], tuple[str, EventHandlerKind]] = {
+    TaskStartedEvent: ("task_started", "trace"),
+    TaskCompletedEvent: ("task_completed", "trace"),
+    TaskFailedEvent: ("task_failed", "trace"),
+    AgentExecutionStartedEvent: ("agent_execution_started", "trace"),
+    AgentExecutionCompletedEvent: ("agent_execution_completed", "trace"),
+    LiteAgentExecutionStartedEvent: ("lite_agent_execution_started", "trace"),
+    LiteAgentExecutionCompletedEvent: ("lite_agent_execution_completed", "trace"),
+    LiteAgentExecutionErrorEvent: ("lite_agent_execution_error", "trace"),
+    AgentExecutionErrorEvent: ("agent_execution_error", "trace"),
+    LLMGuardrailStartedEvent: ("llm_guardrail_started", "trace"),
+    LLMGuardrailCompletedEvent: ("llm_guardrail_completed", "trace"),
+}
+
+_ACTION_EVENT_TABLE: dict[type[BaseEvent], tuple[str, EventHandlerKind]] = {
+    LLMCallStartedEvent: ("llm_call_started", "action"),
+    LLMCallCompletedEvent: ("llm_call_completed", "action"),
+    LLMCallFailedEvent: ("llm_call_failed", "action"),
+    ToolUsageStartedEvent: ("tool_usage_started", "action"),
+    ToolUsageFinishedEvent: ("tool_usage_finished", "action"),
+    ToolUsageErrorEvent: ("tool_usage_error", "action"),
+    ToolFailureDetectedEvent: ("tool_failure_detected", "action"),
+    MemoryQueryStartedEvent: ("memory_query_started", "action"),
+    MemoryQueryCompletedEvent: ("memory_query_completed", "action"),
+    AgentReasoningStartedEvent: ("agent_reasoning_started", "action"),
+    AgentReasoningCompletedEvent: ("agent_reasoning_completed", "action"),
+    AgentReasoningFailedEvent: ("agent_reasoning_failed", "action"),
+    StepObservationStartedEvent: ("step_observation_started", "action"),
+    StepObservationCompletedEvent: ("step_observation_completed", "action"),
+    StepObservationFailedEvent: ("step_observation_failed", "action"),
+    PlanRefinementEvent: ("plan_refinement", "action"),
+    PlanReplanTriggeredEvent: ("plan_replan_triggered", "action"),
+    GoalAchievedEarlyEvent: ("goal_achieved_early", "action"),
+    KnowledgeRetrievalStartedEvent: ("knowledge_retrieval_started", "action"),
+    KnowledgeRetrievalCompletedEvent: ("knowledge_retrieval_completed", "action"),
+    KnowledgeQueryStartedEvent: ("knowledge_query_started", "action"),
+    KnowledgeQueryCompletedEvent: ("knowledge_query_completed", "action"),
+    KnowledgeQueryFailedEvent: ("knowledge_query_failed", "action"),
+    SkillDiscoveryStartedEvent: ("skill_discovery_started", "action"),
+    SkillDiscoveryCompletedEvent: ("skill_discovery_completed", "action"),
+    SkillLoadedEvent: ("skill_loaded", "action"),
+    SkillActivatedEvent: ("skill_activated", "action"),
+    SkillLoadFailedEvent: ("skill_load_failed", "action"),
+    # The other five describe setup; this is the only one that says a
+    # skill was actually used, and the only one that re-fires per
+    # execution. Without it a trace cannot attribute usage to a task.
+    SkillUsedEvent: ("skill_used", "action"),
+}
+
+_A2A_EVENT_TABLE: dict[type[BaseEvent], tuple[str, EventHandlerKind]] = {
+    A2ADelegationStartedEvent: ("a2a_delegation_started", "action"),
+    A2ADelegationCompletedEvent: ("a2a_delegation_completed", "action"),
+    A2AConversationStartedEvent: ("a2a_conversation_started", "action"),
+    A2AMessageSentEvent: ("a2a_message_sent", "action"),
+    A2AResponseReceivedEvent: ("a2a_response_received", "action"),
+    A2AConversationCompletedEvent: ("a2a_conversation_completed", "action"),
+    A2APollingStartedEvent: ("a2a_polling_started", "action"),
+    A2APollingStatusEvent: ("a2a_polling_status", "action"),
+    A2APushNotificationRegisteredEvent: ("a2a_push_notification_registered", "action"),
+    A2APushNotificationReceivedEvent: ("a2a_push_notification_received", "action"),
+    A2APushNotificationSentEvent: ("a2a_push_notification_sent", "action"),
+    A2APushNotificationTimeoutEvent: ("a2a_push_notification_timeout", "action"),
+    A2AStreamingStartedEvent: ("a2a_streaming_started", "action"),
+    A2AStreamingChunkEvent: ("a2a_streaming_chunk", "action"),
+    A2AAgentCardFetchedEvent: ("a2a_agent_card_fetched", "action"),
+    A2AAuthenticationFailedEvent: ("a2a_authentication_failed", "action"),
+    A2AArtifactReceivedEvent: ("a2a_artifact_received", "action"),
+    A2AConnectionErrorEvent: ("a2a_connection_error", "action"),
+    A2AServerTaskStartedEvent: ("a2a_server_task_started", "action"),
+    A2AServerTaskCompletedEvent: ("a2a_server_task_completed", "action"),
+    A2AServerTaskCanceledEvent: ("a2a_server_task_canceled", "action"),
+    A2AServerTaskFailedEvent: ("a2a_server_task_failed", "action"),
+    A2AParallelDelegationStartedEvent: ("a2a_parallel_delegation_started", "action"),
+    A2AParallelDelegationCompletedEvent: (
+        "a2a_parallel_delegation_completed",
+        "action",
+    ),
+}
+
+
+EventDataBuilder = Callable[[Any, Any], dict[str, Any]]
+
+
+def _build_task_started_data(event: Any, source: Any) -> dict[str, Any]:
+    task_name = event.task.name or event.task.description
+    task_display_name = task_name[:80] + "..." if len(task_name) > 80 else task_name
+    return {
+        "task_description": event.task.description,
+        "expected_output": event.task.expected_output,
+        "task_name": task_name,
+        "task_display_name": task_display_name,
+        "context": event.context,
+        "agent_role": source.agent.role,
+        "task_id": str(event.task.id),
+    }
+
+
+def _build_task_completed_data(event: Any, source: Any) -> dict[str, Any]:
+    return {
+        "task_description": event.task.description if event.task else None,
+        "task_name": event.task.name or event.task.description if event.task else None,
+        "task_id": str(event.task.id) if event.task else None,
+        "output_raw": event.output.raw if event.output else None,
+        "output_format": str(event.output.output_format) if event.output else None,
+        "agent_role": event.output.agent if event.output else None,
+    }
+
+
+def _build_agent_execution_data(event: Any, source: Any) -> dict[str, Any]:
+    return {
+        "agent_role": event.agent.role,
+        "agent_goal": event.agent.goal,
+        "agent_backstory": event.agent.backstory,
+    }
+
+
+def _build_llm_call_started_data(event: Any, source: Any) -> dict[str, Any]:
+    event_data = safe_serialize_to_dict(event)
+    event_data["task_name"] = event.task_name or getattr(
+        event, "task_description", None
+    )
+    return event_data
+
+
 class TraceCollectionListener(BaseEventListener):
     """Trace collection listener that orchestrates trace collection."""
 
-    complex_events: ClassVar[list[str]] = [
-        "task_started",
-        "task_completed",
-        "llm_call_started",
-        "llm_call_completed",
-        "agent_execution_started",
-        "agent_execution_completed",
-    ]
-
-    _instance: Self | None = None
-    _initialized: bool = False
-    _listeners_setup: bool = False
+    _event_data_builders: ClassVar[dict[str, EventDataBuilder]] = {
+        "task_started": _build_task_started_data,
+        "task_completed": _build_task_completed_data,
+        "llm_call_started": _build_llm_call_started_data,
+        "agent_execution_started": _build_agent_execution_data,
+        "agent_execution_completed": _build_agent_execution_data,
+    }
 
-    def __new__(cls, batch_manager: TraceBatchManager | None = None) -> Self:
-        """Create or return singleton instance."""
-        if cls._instance is None:
-            cls._instance = super().__new__(cls)
-        return cls._instance
+    _listeners_setup: bool = False
 
     def __init__(
         self,
@@ -166,37 +301,67 @@ class TraceCollectionListener(BaseEventListener):
     ) -> None:
         """Initialize trace collection listener.
 
+        Use :func:`get_trace_listener` for the process-wide instance; building
+        the listener directly registers another set of bus handlers.
+
         Args:
             batch_manager: Optional trace batch manager instance.
             formatter: Optional console formatter for output.
         """
-        if self._initialized:
-            return
-
         super().__init__()
         self.batch_manager = batch_manager or TraceBatchManager()
-        self._initialized = True
         self.first_time_handler = FirstTimeTraceHandler()
-        self.formatter = formatter
+        self._formatter = formatter
         self.memory_retrieval_in_progress = False
         self.memory_save_in_progress = False
+        self._user_id = os.getenv("CREWAI_USER_ID", "anonymous")
+        self._organization_id = os.getenv("CREWAI_ORG_ID", "")
+        self._session_id = str(uuid.uuid4())
+        self._auth_cache: tuple[float, bool] | None = None
 
         if self.first_time_handler.initialize_for_first_time_user():
             self.first_time_handler.set_batch_manager(self.batch_manager)
 
+    @property
+    def formatter(self) -> ConsoleFormatter | None:
+        """Console formatter, defaulting to the active ``EventListener``'s."""
+        if self._formatter is not None:
+            return self._formatter
+        console = EventListener._instance
+        return console.formatter if console is not None else None
+
+    @formatter.setter
+    def formatter(self, formatter: ConsoleFormatter | None) -> None:
+        self._formatter = formatter
+
     def _check_authenticated(self) -> bool:
-        """Check if tracing should be enabled."""
+        """Check if tracing should be enabled.
+
+        The result is cached for ``_AUTH_CACHE_TTL_SECONDS`` so repeated
+        kickoffs in a long-running process don't re-read the token each batch.
+        """
+        now = time.monotonic()
+        if self._auth_cache is not None:
+            checked_at, authenticated = self._auth_cache
+            if now - checked_at < _AUTH_CACHE_TTL_SECONDS:
+                return authenticated
         try:
-            return bool(get_auth_token())
+            authenticated = bool(get_auth_token())
         except AuthError:
-            return False
+            authenticated = False
+        self._auth_cache = (now, authenticated)
+        return authenticated
 
     def _get_user_context(self) -> dict[str, str]:
-        """Extract user context for tracing."""
+        """Extract user context for tracing.
+
+        User, organization and session are fixed for the process; only the
+        trace id is minted per batch.
+        """
         return {
-            "user_id": os.getenv("CREWAI_USER_ID", "anonymous"),
-            "organization_id": os.getenv("CREWAI_ORG_ID", ""),
-            "session_id": str(uuid.uuid4()),
+            "user_id": self._user_id,
+            "organization_id": self._organization_id,
+            "session_id": self._session_id,
             "trace_id": str(uuid.uuid4()),
         }
 
@@ -228,12 +393,27 @@ class TraceCollectionListener(BaseEventListener):
 
         self._listeners_setup = True
 
+    def _register_event_table(
+        self,
+        event_bus: CrewAIEventsBus,
+        table: dict[type[BaseEvent], tuple[str, EventHandlerKind]],
+    ) -> None:
+        """Register one generic dispatcher per event class in ``table``."""
+        for event_class, (event_type, kind) in table.items():
+            event_bus.on(event_class)(partial(self._dispatch_event, event_type, kind))
+
+    def _dispatch_event(
+        self, event_type: str, kind: EventHandlerKind, source: Any, event: Any
+    ) -> None:
+        """Forward a table-registered event to the trace or action handler."""
+        if kind == "action":
+            self._handle_action_event(event_type, source, event)
+        else:
+            self._handle_trace_event(event_type, source, event)
+
     def _register_flow_event_handlers(self, event_bus: CrewAIEventsBus) -> None:
         """Register handlers for flow events."""
-
-        @event_bus.on(FlowCreatedEvent)
-        def on_flow_created(source: Any, event: FlowCreatedEvent) -> None:
-            pass
+        self._register_event_table(event_bus, _FLOW_EVENT_TABLE)
 
         @event_bus.on(FlowStartedEvent)
         def on_flow_started(source: Any, event: FlowStartedEvent) -> None:
@@ -243,53 +423,20 @@ class TraceCollectionListener(BaseEventListener):
             # parent flow -- and must NOT re-claim ownership. Re-claiming would
             # mark batch_owner_type="flow" and cause the nested flow to finalize
             # the parent's batch prematurely when it completes.
+            if not self._should_collect():
+                return
             if not self.batch_manager.is_batch_initialized():
                 self._initialize_flow_batch(source, event)
             self._handle_trace_event("flow_started", source, event)
 
-        @event_bus.on(MethodExecutionStartedEvent)
-        def on_method_started(source: Any, event: MethodExecutionStartedEvent) -> None:
-            self._handle_trace_event("method_execution_started", source, event)
-
-        @event_bus.on(MethodExecutionFinishedEvent)
-        def on_method_finished(
-            source: Any, event: MethodExecutionFinishedEvent
-        ) -> None:
-            self._handle_trace_event("method_execution_finished", source, event)
-
-        @event_bus.on(MethodExecutionFailedEvent)
-        def on_method_failed(source: Any, event: MethodExecutionFailedEvent) -> None:
-            self._handle_trace_event("method_execution_failed", source, event)
-
-        @event_bus.on(ConversationMessageAddedEvent)
-        def on_conversation_message_added(
-            source: Any, event: ConversationMessageAddedEvent
-        ) -> None:
-            self._handle_action_event("conversation_message_added", source, event)
-
-        @event_bus.on(ConversationRouteSelectedEvent)
-        def on_conversation_route_selected(
-            source: Any, event: ConversationRouteSelectedEvent
-        ) -> None:
-            self._handle_action_event("conversation_route_selected", source, event)
-
-        @event_bus.on(FlowFinishedEvent)
-        def on_flow_finished(source: Any, event: FlowFinishedEvent) -> None:
-            self._handle_trace_event("flow_finished", source, event)
-
-        @event_bus.on(FlowFailedEvent)
-        def on_flow_failed(source: Any, event: FlowFailedEvent) -> None:
-            self._handle_trace_event("flow_failed", source, event)
-
-        @event_bus.on(FlowPlotEvent)
-        def on_flow_plot(source: Any, event: FlowPlotEvent) -> None:
-            self._handle_action_event("flow_plot", source, event)
-
     def _register_context_event_handlers(self, event_bus: CrewAIEventsBus) -> None:
         """Register handlers for context events (start/end)."""
+        self._register_event_table(event_bus, _CONTEXT_EVENT_TABLE)
 
         @event_bus.on(CrewKickoffStartedEvent)
         def on_crew_started(source: Any, event: CrewKickoffStartedEvent) -> None:
+            if not self._should_collect():
+                return
             # Nested crew inside Flow.kickoff: never claim an existing flow session batch.
             if not self._nested_in_flow_execution() and (
                 not self.batch_manager.is_batch_initialized()
@@ -336,104 +483,9 @@ class TraceCollectionListener(BaseEventListener):
             elif self.batch_manager.batch_owner_type == "crew":
                 self.batch_manager.finalize_batch()
 
-        @event_bus.on(TaskStartedEvent)
-        def on_task_started(source: Any, event: TaskStartedEvent) -> None:
-            self._handle_trace_event("task_started", source, event)
-
-        @event_bus.on(TaskCompletedEvent)
-        def on_task_completed(source: Any, event: TaskCompletedEvent) -> None:
-            self._handle_trace_event("task_completed", source, event)
-
-        @event_bus.on(TaskFailedEvent)
-        def on_task_failed(source: Any, event: TaskFailedEvent) -> None:
-            self._handle_trace_event("task_failed", source, event)
-
-        @event_bus.on(AgentExecutionStartedEvent)
-        def on_agent_started(source: Any, event: AgentExecutionStartedEvent) -> None:
-            self._handle_trace_event("agent_execution_started", source, event)
-
-        @event_bus.on(AgentExecutionCompletedEvent)
-        def on_agent_completed(
-            source: Any, event: AgentExecutionCompletedEvent
-        ) -> None:
-            self._handle_trace_event("agent_execution_completed", source, event)
-
-        @event_bus.on(LiteAgentExecutionStartedEvent)
-        def on_lite_agent_started(
-            source: Any, event: LiteAgentExecutionStartedEvent
-        ) -> None:
-            self._handle_trace_event("lite_agent_execution_started", source, event)
-
-        @event_bus.on(LiteAgentExecutionCompletedEvent)
-        def on_lite_agent_completed(
-            source: Any, event: LiteAgentExecutionCompletedEvent
-        ) -> None:
-            self._handle_trace_event("lite_agent_execution_completed", source, event)
-
-        @event_bus.on(LiteAgentExecutionErrorEvent)
-        def on_lite_agent_error(
-            source: Any, event: LiteAgentExecutionErrorEvent
-        ) -> None:
-            self._handle_trace_event("lite_agent_execution_error", source, event)
-
-        @event_bus.on(AgentExecutionErrorEvent)
-        def on_agent_error(source: Any, event: AgentExecutionErrorEvent) -> None:
-            self._handle_trace_event("agent_execution_error", source, event)
-
-        @event_bus.on(LLMGuardrailStartedEvent)
-        def on_guardrail_started(source: Any, event: LLMGuardrailStartedEvent) -> None:
-            self._handle_trace_event("llm_guardrail_started", source, event)
-
-        @event_bus.on(LLMGuardrailCompletedEvent)
-        def on_guardrail_completed(
-            source: Any, event: LLMGuardrailCompletedEvent
-        ) -> None:
-            self._handle_trace_event("llm_guardrail_completed", source, event)
-
     def _register_action_event_handlers(self, event_bus: CrewAIEventsBus) -> None:
         """Register handlers for action events (LLM calls, tool usage)."""
-
-        @event_bus.on(LLMCallStartedEvent)
-        def on_llm_call_started(source: Any, event: LLMCallStartedEvent) -> None:
-            self._handle_action_event("llm_call_started", source, event)
-
-        @event_bus.on(LLMCallCompletedEvent)
-        def on_llm_call_completed(source: Any, event: LLMCallCompletedEvent) -> None:
-            self._handle_action_event("llm_call_completed", source, event)
-
-        @event_bus.on(LLMCallFailedEvent)
-        def on_llm_call_failed(source: Any, event: LLMCallFailedEvent) -> None:
-            self._handle_action_event("llm_call_failed", source, event)
-
-        @event_bus.on(ToolUsageStartedEvent)
-        def on_tool_started(source: Any, event: ToolUsageStartedEvent) -> None:
-            self._handle_action_event("tool_usage_started", source, event)
-
-        @event_bus.on(ToolUsageFinishedEvent)
-        def on_tool_finished(source: Any, event: ToolUsageFinishedEvent) -> None:
-            self._handle_action_event("tool_usage_finished", source, event)
-
-        @event_bus.on(ToolUsageErrorEvent)
-        def on_tool_error(source: Any, event: ToolUsageErrorEvent) -> None:
-            self._handle_action_event("tool_usage_error", source, event)
-
-        @event_bus.on(ToolFailureDetectedEvent)
-        def on_tool_failure_detected(
-            source: Any, event: ToolFailureDetectedEvent
-        ) -> None:
-            self._handle_action_event("tool_failure_detected", source, event)
-
-        @event_bus.on(MemoryQueryStartedEvent)
-        def on_memory_query_started(
-            source: Any, event: MemoryQueryStartedEvent
-        ) -> None:
-            self._handle_action_event("memory_query_started", source, event)
-
-        @event_bus.on(MemoryQueryCompletedEvent)
-        def on_memory_query_completed(
-            source: Any, event: MemoryQueryCompletedEvent
-        ) -> None:
-            self._handle_action_event("memory_query_completed", source, event)
+        self._register_event_table(event_bus, _ACTION_EVENT_TABLE)
 
         @event_bus.on(MemoryQueryFailedEvent)
         def on_memory_query_failed(source: Any, event: MemoryQueryFailedEvent) -> None:
@@ -506,257 +558,9 @@ class TraceCollectionListener(BaseEventListener):
                     event.retrieval_time_ms,
                 )
 
-        @event_bus.on(AgentReasoningStartedEvent)
-        def on_agent_reasoning_started(
-            source: Any, event: AgentReasoningStartedEvent
-        ) -> None:
-            self._handle_action_event("agent_reasoning_started", source, event)
-
-        @event_bus.on(AgentReasoningCompletedEvent)
-        def on_agent_reasoning_completed(
-            source: Any, event: AgentReasoningCompletedEvent
-        ) -> None:
-            self._handle_action_event("agent_reasoning_completed", source, event)
-
-        @event_bus.on(AgentReasoningFailedEvent)
-        def on_agent_reasoning_failed(
-            source: Any, event: AgentReasoningFailedEvent
-        ) -> None:
-            self._handle_action_event("agent_reasoning_failed", source, event)
-
-        @event_bus.on(StepObservationStartedEvent)
-        def on_step_observation_started(
-            source: Any, event: StepObservationStartedEvent
-        ) -> None:
-            self._handle_action_event("step_observation_started", source, event)
-
-        @event_bus.on(StepObservationCompletedEvent)
-        def on_step_observation_completed(
-            source: Any, event: StepObservationCompletedEvent
-        ) -> None:
-            self._handle_action_event("step_observation_completed", source, event)
-
-        @event_bus.on(StepObservationFailedEvent)
-        def on_step_observation_failed(
-            source: Any, event: StepObservationFailedEvent
-        ) -> None:
-            self._handle_action_event("step_observation_failed", source, event)
-
-        @event_bus.on(PlanRefinementEvent)
-        def on_plan_refinement(source: Any, event: PlanRefinementEvent) -> None:
-            self._handle_action_event("plan_refinement", source, event)
-
-        @event_bus.on(PlanReplanTriggeredEvent)
-        def on_plan_replan_triggered(
-            source: Any, event: PlanReplanTriggeredEvent
-        ) -> None:
-            self._handle_action_event("plan_replan_triggered", source, event)
-
-        @event_bus.on(GoalAchievedEarlyEvent)
-        def on_goal_achieved_early(source: Any, event: GoalAchievedEarlyEvent) -> None:
-            self._handle_action_event("goal_achieved_early", source, event)
-
-        @event_bus.on(KnowledgeRetrievalStartedEvent)
-        def on_knowledge_retrieval_started(
-            source: Any, event: KnowledgeRetrievalStartedEvent
-        ) -> None:
-            self._handle_action_event("knowledge_retrieval_started", source, event)
-
-        @event_bus.on(KnowledgeRetrievalCompletedEvent)
-        def on_knowledge_retrieval_completed(
-            source: Any, event: KnowledgeRetrievalCompletedEvent
-        ) -> None:
-            self._handle_action_event("knowledge_retrieval_completed", source, event)
-
-        @event_bus.on(KnowledgeQueryStartedEvent)
-        def on_knowledge_query_started(
-            source: Any, event: KnowledgeQueryStartedEvent
-        ) -> None:
-            self._handle_action_event("knowledge_query_started", source, event)
-
-        @event_bus.on(KnowledgeQueryCompletedEvent)
-        def on_knowledge_query_completed(
-            source: Any, event: KnowledgeQueryCompletedEvent
-        ) -> None:
-            self._handle_action_event("knowledge_query_completed", source, event)
-
-        @event_bus.on(KnowledgeQueryFailedEvent)
-        def on_knowledge_query_failed(
-            source: Any, event: KnowledgeQueryFailedEvent
-        ) -> None:
-            self._handle_action_event("knowledge_query_failed", source, event)
-
-        @event_bus.on(SkillDiscoveryStartedEvent)
-        def on_skill_discovery_started(
-            source: Any, event: SkillDiscoveryStartedEvent
-        ) -> None:
-            self._handle_action_event("skill_discovery_started", source, event)
-
-        @event_bus.on(SkillDiscoveryCompletedEvent)
-        def on_skill_discovery_completed(
-            source: Any, event: SkillDiscoveryCompletedEvent
-        ) -> None:
-            self._handle_action_event("skill_discovery_completed", source, event)
-
-        @event_bus.on(SkillLoadedEvent)
-        def on_skill_loaded(source: Any, event: SkillLoadedEvent) -> None:
-            self._handle_action_event("skill_loaded", source, event)
-
-        @event_bus.on(SkillActivatedEvent)
-        def on_skill_activated(source: Any, event: SkillActivatedEvent) -> None:
-            self._handle_action_event("skill_activated", source, event)
-
-        @event_bus.on(SkillLoadFailedEvent)
-        def on_skill_load_failed(source: Any, event: SkillLoadFailedEvent) -> None:
-            self._handle_action_event("skill_load_failed", source, event)
-
-        @event_bus.on(SkillUsedEvent)
-        def on_skill_used(source: Any, event: SkillUsedEvent) -> None:
-            # The other five describe setup; this is the only one that says a
-            # skill was actually used, and the only one that re-fires per
-            # execution. Without it a trace cannot attribute usage to a task.
-            self._handle_action_event("skill_used", source, event)
-
     def _register_a2a_event_handlers(self, event_bus: CrewAIEventsBus) -> None:
         """Register handlers for A2A (Agent-to-Agent) events."""
-
-        @event_bus.on(A2ADelegationStartedEvent)
-        def on_a2a_delegation_started(
-            source: Any, event: A2ADelegationStartedEvent
-        ) -> None:
-            self._handle_action_event("a2a_delegation_started", source, event)
-
-        @event_bus.on(A2ADelegationCompletedEvent)
-        def on_a2a_delegation_completed(
-            source: Any, event: A2ADelegationCompletedEvent
-        ) -> None:
-            self._handle_action_event("a2a_delegation_completed", source, event)
-
-        @event_bus.on(A2AConversationStartedEvent)
-        def on_a2a_conversation_started(
-            source: Any, event: A2AConversationStartedEvent
-        ) -> None:
-            self._handle_action_event("a2a_conversation_started", source, event)
-
-        @event_bus.on(A2AMessageSentEvent)
-        def on_a2a_message_sent(source: Any, event: A2AMessageSentEvent) -> None:
-            self._handle_action_event("a2a_message_sent", source, event)
-
-        @event_bus.on(A2AResponseReceivedEvent)
-        def on_a2a_response_received(
-            source: Any, event: A2AResponseReceivedEvent
-        ) -> None:
-            self._handle_action_event("a2a_response_received", source, event)
-
-        @event_bus.on(A2AConversationCompletedEvent)
-        def on_a2a_conversation_completed(
-            source: Any, event: A2AConversationCompletedEvent
-        ) -> None:
-            self._handle_action_event("a2a_conversation_completed", source, event)
-
-        @event_bus.on(A2APollingStartedEvent)
-        def on_a2a_polling_started(source: Any, event: A2APollingStartedEvent) -> None:
-            self._handle_action_event("a2a_polling_started", source, event)
-
-        @event_bus.on(A2APollingStatusEvent)
-        def on_a2a_polling_status(source: Any, event: A2APollingStatusEvent) -> None:
-            self._handle_action_event("a2a_polling_status", source, event)
-
-        @event_bus.on(A2APushNotificationRegisteredEvent)
-        def on_a2a_push_notification_registered(
-            source: Any, event: A2APushNotificationRegisteredEvent
-        ) -> None:
-            self._handle_action_event("a2a_push_notification_registered", source, event)
-
-        @event_bus.on(A2APushNotificationReceivedEvent)
-        def on_a2a_push_notification_received(
-            source: Any, event: A2APushNotificationReceivedEvent
-        ) -> None:
-            self._handle_action_event("a2a_push_notification_received", source, event)
-
-        @event_bus.on(A2APushNotificationSentEvent)
-        def on_a2a_push_notification_sent(
-            source: Any, event: A2APushNotificationSentEvent
-        ) -> None:
-            self._handle_action_event("a2a_push_notification_sent", source, event)
-
-        @event_bus.on(A2APushNotificationTimeoutEvent)
-        def on_a2a_push_notification_timeout(
-            source: Any, event: A2APushNotificationTimeoutEvent
-        ) -> None:
-            self._handle_action_event("a2a_push_notification_timeout", source, event)
-
-        @event_bus.on(A2AStreamingStartedEvent)
-        def on_a2a_streaming_started(
-            source: Any, event: A2AStreamingStartedEvent
-        ) -> None:
-            self._handle_action_event("a2a_streaming_started", source, event)
-
-        @event_bus.on(A2AStreamingChunkEvent)
-        def on_a2a_streaming_chunk(source: Any, event: A2AStreamingChunkEvent) -> None:
-            self._handle_action_event("a2a_streaming_chunk", source, event)
-
-        @event_bus.on(A2AAgentCardFetchedEvent)
-        def on_a2a_agent_card_fetched(
-            source: Any, event: A2AAgentCardFetchedEvent
-        ) -> None:
-            self._handle_action_event("a2a_agent_card_fetched", source, event)
-
-        @event_bus.on(A2AAuthenticationFailedEvent)
-        def on_a2a_authentication_failed(
-            source: Any, event: A2AAuthenticationFailedEvent
-        ) -> None:
-            self._handle_action_event("a2a_authentication_failed", source, event)
-
-        @event_bus.on(A2AArtifactReceivedEvent)
-        def on_a2a_artifact_received(
-            source: Any, event: A2AArtifactReceivedEvent
-        ) -> None:
-            self._handle_action_event("a2a_artifact_received", source, event)
-
-        @event_bus.on(A2AConnectionErrorEvent)
-        def on_a2a_connection_error(
-            source: Any, event: A2AConnectionErrorEvent
-        ) -> None:
-            self._handle_action_event("a2a_connection_error", source, event)
-
-        @event_bus.on(A2AServerTaskStartedEvent)
-        def on_a2a_server_task_started(
-            source: Any, event: A2AServerTaskStartedEvent
-        ) -> None:
-            self._handle_action_event("a2a_server_task_started", source, event)
-
-        @event_bus.on(A2AServerTaskCompletedEvent)
-        def on_a2a_server_task_completed(
-            source: Any, event: A2AServerTaskCompletedEvent
-        ) -> None:
-            self._handle_action_event("a2a_server_task_completed", source, event)
-
-        @event_bus.on(A2AServerTaskCanceledEvent)
-        def on_a2a_server_task_canceled(
-            source: Any, event: A2AServerTaskCanceledEvent
-        ) -> None:
-            self._handle_action_event("a2a_server_task_canceled", source, event)
-
-        @event_bus.on(A2AServerTaskFailedEvent)
-        def on_a2a_server_task_failed(
-            source: Any, event: A2AServerTaskFailedEvent
-        ) -> None:
-            self._handle_action_event("a2a_server_task_failed", source, event)
-
-        @event_bus.on(A2AParallelDelegationStartedEvent)
-        def on_a2a_parallel_delegation_started(
-            source: Any, event: A2AParallelDelegationStartedEvent
-        ) -> None:
-            self._handle_action_event("a2a_parallel_delegation_started", source, event)
-
-        @event_bus.on(A2AParallelDelegationCompletedEvent)
-        def on_a2a_parallel_delegation_completed(
-            source: Any, event: A2AParallelDelegationCompletedEvent
-        ) -> None:
-            self._handle_action_event(
-                "a2a_parallel_delegation_completed", source, event
-            )
+        self._register_event_table(event_bus, _A2A_EVENT_TABLE)
 
     def _register_system_event_handlers(self, event_bus: CrewAIEventsBus) -> None:
         """Register handlers for system signal events (SIGTERM, SIGINT, etc.)."""
@@ -893,30 +697,58 @@ class TraceCollectionListener(BaseEventListener):
             user_context, execution_metadata, use_ephemeral=use_ephemeral
         )
 
+    def _should_collect(self) -> bool:
+        """True when an event in the current context can reach a trace.
+
+        Handlers stay registered for the process once any run enables tracing,
+        so a later run with tracing disabled would otherwise still build and
+        buffer every event. Only context variables and instance state are
+        read here, keeping the check cheap enough for every event. An active
+        batch keeps collecting so nested untraced crews still report to the
+        flow that owns the session.
+        """
+        return (
+            is_tracing_enabled_in_context()
+            or self.batch_manager.current_batch is not None
+            or self.first_time_handler.is_first_time
+            or is_tui_mode()
+        )
+
     def _handle_trace_event(self, event_type: str, source: Any, event: Any) -> None:
-        """Generic handler for context end events.
+        """Generic handler for lifecycle trace events.
+
+        Runs on the event bus sync-handler pool rather than the emitting
+        thread, so serialization here does not add latency to the traced call.
+        The pending-event counter lets ``finalize_batch`` wait for in-flight
+        handlers before sending.
 
         Args:
             event_type: Type of the event.
             source: Source object that triggered the event.
             event: Event object.
         """
-        self.batch_manager.begin_event_processing()
-        try:
-            trace_event = self._create_trace_event(event_type, source, event)
-            self.batch_manager.add_event(trace_event)
-        finally:
-            self.batch_manager.end_event_processing()
+        if not self._should_collect():
+            return
+        batch_manager = self.batch_manager
+        with batch_manager.processing():
+            batch_manager.add_event(self._create_trace_event(event_type, source, event))
 
     def _handle_action_event(self, event_type: str, source: Any, event: Any) -> None:
         """Generic handler for action events (LLM calls, tool usage).
 
+        Like ``_handle_trace_event``, this runs on the event bus sync-handler
+        pool and lazily claims a batch when none is active yet.
+
         Args:
             event_type: Type of the event.
             source: Source object that triggered the event.
             event: Event object.
         """
-        if not self.batch_manager.is_batch_initialized():
+        if not self._should_collect():
+            return
+        batch_manager = self.batch_manager
+        # Read the batch directly: this runs for every LLM and tool event.
+        if batch_manager.current_batch is None:
             if self._try_initialize_flow_batch_from_context(event):
                 pass
             elif not self._nested_in_flow_execution():
@@ -925,18 +757,12 @@ class TraceCollectionListener(BaseEventListener):
                     "crew_name": getattr(source, "name", "Unknown Crew"),
                     "crewai_version": get_crewai_version(),
                 }
-                self.batch_manager.batch_owner_type = "crew"
-                self.batch_manager.batch_owner_id = getattr(
-                    source, "id", str(uuid.uuid4())
-                )
+                batch_manager.batch_owner_type = "crew"
+                batch_manager.batch_owner_id = getattr(source, "id", str(uuid.uuid4()))
                 self._initialize_batch(user_context, execution_metadata)
 
-        self.batch_manager.begin_event_processing()
-        try:
-            trace_event = self._create_trace_event(event_type, source, event)
-            self.batch_manager.add_event(trace_event)
-        finally:
-            self.batch_manager.end_event_processing()
+        with batch_manager.processing():
+            batch_manager.add_event(self._create_trace_event(event_type, source, event))
 
     def _create_trace_event(
         self, event_type: str, source: Any, event: BaseEvent
@@ -960,61 +786,10 @@ class TraceCollectionListener(BaseEventListener):
         self, event_type: str, event: Any, source: Any
     ) -> dict[str, Any]:
         """Build event data"""
-        if event_type not in self.complex_events:
-            return safe_serialize_to_dict(event)
-        if event_type == "task_started":
-            task_name = event.task.name or event.task.description
-            task_display_name = (
-                task_name[:80] + "..." if len(task_name) > 80 else task_name
-            )
-            return {
-                "task_description": event.task.description,
-                "expected_output": event.task.expected_output,
-                "task_name": task_name,
-                "task_display_name": task_display_name,
-                "context": event.context,
-                "agent_role": source.agent.role,
-                "task_id": str(event.task.id),
-            }
-        if event_type == "task_completed":
-            return {
-                "task_description": event.task.description if event.task else None,
-                "task_name": event.task.name or event.task.description
-                if event.task
-                else None,
-                "task_id": str(event.task.id) if event.task else None,
-                "output_raw": event.output.raw if event.output else None,
-                "output_format": str(event.output.output_format)
-                if event.output
-                else None,
-                "agent_role": event.output.agent if event.output else None,
-            }
-        if event_type == "agent_execution_started":
-            return {
-                "agent_role": event.agent.role,
-                "agent_goal": event.agent.goal,
-                "agent_backstory": event.agent.backstory,
-            }
-        if event_type == "agent_execution_completed":
-            return {
-                "agent_role": event.agent.role,
-                "agent_goal": event.agent.goal,
-                "agent_backstory": event.agent.backstory,
-            }
-        if event_type == "llm_call_started":
-            event_data = safe_serialize_to_dict(event)
-            event_data["task_name"] = event.task_name or getattr(
-                event, "task_description", None
-            )
-            return event_data
-        if event_type == "llm_call_completed":
+        builder = self._event_data_builders.get(event_type)
+        if builder is None:
             return safe_serialize_to_dict(event)
-
-        return {
-            "event_type": event_type,
-            "event": safe_serialize_to_dict(event),
-            "source": source,
-        }
+        return builder(event, source)
 
     def _show_tracing_disabled_message(self) -> None:
         """Show a message when tracing is disabled."""
@@ -1053,3 +828,24 @@ To enable tracing, do any one of these:
             padding=(1, 2),
         )
         console.print(panel)
+
+
+_trace_listener: TraceCollectionListener | None = None
+_trace_listener_lock = threading.Lock()
+
+
+def get_trace_listener() -> TraceCollectionListener:
+    """Return the process-wide trace listener, creating it on first use."""
+    global _trace_listener
+    listener = _trace_listener
+    if listener is None:
+        with _trace_listener_lock:
+            if _trace_listener is None:
+                _trace_listener = TraceCollectionListener()
+            listener = _trace_listener
+    return listener
+
+
+def get_current_trace_listener() -> TraceCollectionListener | None:
+    """Return the process-wide trace listener if it has been created."""
+    return _trace_listener
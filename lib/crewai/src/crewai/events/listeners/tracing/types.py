@@ -1,10 +1,10 @@
-from dataclasses import asdict, dataclass, field
+from dataclasses import dataclass, field
 from datetime import datetime, timezone
 from typing import Any
 import uuid
 
 
-@dataclass
+@dataclass(slots=True)
 class TraceEvent:
     """Individual trace event payload"""
 
@@ -21,4 +21,15 @@ class TraceEvent:
     triggered_by_event_id: str | None = None
 
     def to_dict(self) -> dict[str, Any]:
-        return asdict(self)
+        # Built directly rather than via dataclasses.asdict, which deep-copies
+        # event_data recursively for every event in the outgoing payload.
+        return {
+            "event_id": self.event_id,
+            "timestamp": self.timestamp,
+            "type": self.type,
+            "event_data": self.event_data,
+            "emission_sequence": self.emission_sequence,
+            "parent_event_id": self.parent_event_id,
+            "previous_event_id": self.previous_event_id,
+            "triggered_by_event_id": self.triggered_by_event_id,
+        }
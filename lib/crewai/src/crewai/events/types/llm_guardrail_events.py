@@ -1,10 +1,27 @@
 from collections.abc import Callable
-from inspect import getsource
+from functools import lru_cache
+from inspect import getsource, unwrap
+from types import CodeType
 from typing import Any, Literal
 
 from crewai.events.base_events import BaseEvent
 
 
+@lru_cache(maxsize=1024)
+def _code_source(filename: str, firstlineno: int, code: CodeType) -> str:
+    # Code objects compare equal across files when their bytecode matches,
+    # so the cache is keyed on where the code came from as well.
+    return getsource(code).strip()
+
+
+def _guardrail_source(guardrail: Callable[..., Any]) -> str:
+    """Return a function guardrail's source, cached per code object."""
+    code = getattr(unwrap(guardrail), "__code__", None)
+    if isinstance(code, CodeType):
+        return _code_source(code.co_filename, code.co_firstlineno, code)
+    return getsource(guardrail).strip()
+
+
 class LLMGuardrailBaseEvent(BaseEvent):
     task_id: str | None = None
     task_name: str | None = None
@@ -50,7 +67,7 @@ class LLMGuardrailStartedEvent(LLMGuardrailBaseEvent):
         elif callable(self.guardrail):
             self.guardrail_type = "function"
             self.guardrail_name = getattr(self.guardrail, "__name__", None)
-            self.guardrail = getsource(self.guardrail).strip()
+            self.guardrail = _guardrail_source(self.guardrail)
 
 
 class LLMGuardrailCompletedEvent(LLMGuardrailBaseEvent):
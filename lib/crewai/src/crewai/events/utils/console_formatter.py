@@ -115,7 +115,7 @@ To update, run: uv sync --upgrade-package crewai"""
     def _show_tracing_disabled_message_if_needed(self) -> None:
         """Show tracing disabled message if tracing is not enabled."""
         from crewai.events.listeners.tracing.trace_listener import (
-            TraceCollectionListener,
+            get_current_trace_listener,
         )
         from crewai.events.listeners.tracing.utils import (
             has_user_declined_tracing,
@@ -128,7 +128,7 @@ To update, run: uv sync --upgrade-package crewai"""
 
         # Don't show "disabled" message when the first-time handler will show
         # the trace prompt after execution completes (avoids confusing mid-flow messages)
-        listener = TraceCollectionListener._instance  # type: ignore[misc]
+        listener = get_current_trace_listener()
         if listener and listener.first_time_handler.is_first_time:
             return
 
@@ -1208,9 +1208,7 @@ class _ConversationalMixin:
         """
         from crewai.events.event_bus import crewai_event_bus
         from crewai.events.event_context import restore_event_scope
-        from crewai.events.listeners.tracing.trace_listener import (
-            TraceCollectionListener,
-        )
+        from crewai.events.listeners.tracing.trace_listener import get_trace_listener
         from crewai.events.types.flow_events import FlowFinishedEvent
 
         # Background memory saves must finish (and emit their completed/failed
@@ -1253,7 +1251,7 @@ class _ConversationalMixin:
                 restore_event_scope(())
                 object.__setattr__(self, "_deferred_flow_started_event_id", None)
 
-        trace_listener = TraceCollectionListener()
+        trace_listener = get_trace_listener()
         batch_manager = trace_listener.batch_manager
         try:
             if batch_manager.batch_owner_type == "flow":
@@ -56,9 +56,6 @@ from crewai.events.event_context import (
     restore_event_scope,
     triggered_by_scope,
 )
-from crewai.events.listeners.tracing.trace_listener import (
-    TraceCollectionListener,
-)
 from crewai.events.listeners.tracing.utils import (
     has_user_declined_tracing,
     set_tracing_enabled,
@@ -708,6 +705,9 @@ class Flow(BaseModel, Generic[T], metaclass=FlowMeta):
     _pending_events: dict[PendingListenerKey, set[str]] = PrivateAttr(
         default_factory=dict
     )
+    _condition_events_cache: dict[PendingListenerKey, tuple[frozenset[str], bool]] = (
+        PrivateAttr(default_factory=dict)
+    )
     _fired_or_listeners: set[FlowMethodName] = PrivateAttr(default_factory=set)
     _racing_groups_cache: dict[frozenset[FlowMethodName], FlowMethodName] | None = (
         PrivateAttr(default=None)
@@ -784,7 +784,9 @@ class Flow(BaseModel, Generic[T], metaclass=FlowMeta):
         tracing_enabled = should_enable_tracing(override=self.tracing)
         set_tracing_enabled(tracing_enabled)
 
-        trace_listener = TraceCollectionListener()
+        from crewai.events.listeners.tracing.trace_listener import get_trace_listener
+
+        trace_listener = get_trace_listener()
         trace_listener.setup_listeners(crewai_event_bus)
 
         if not self.suppress_flow_events:
@@ -1575,7 +1577,11 @@ class Flow(BaseModel, Generic[T], metaclass=FlowMeta):
                 except Exception:
                     logger.warning("FlowFinishedEvent handler failed", exc_info=True)
 
-            trace_listener = TraceCollectionListener()
+            from crewai.events.listeners.tracing.trace_listener import (
+                get_trace_listener,
+            )
+
+            trace_listener = get_trace_listener()
             if (
                 trace_listener.batch_manager.batch_owner_type == "flow"
                 and current_flow_id.get() == self.flow_id
@@ -2265,7 +2271,11 @@ class Flow(BaseModel, Generic[T], metaclass=FlowMeta):
                 defer_trace_finalization and deferred_started_event_id
             )
             if current_flow_id.get() == self.flow_id:
-                TraceCollectionListener().batch_manager.defer_session_finalization = (
+                from crewai.events.listeners.tracing.trace_listener import (
+                    get_trace_listener,
+                )
+
+                get_trace_listener().batch_manager.defer_session_finalization = (
                     defer_trace_finalization
                 )
 
@@ -2462,7 +2472,11 @@ class Flow(BaseModel, Generic[T], metaclass=FlowMeta):
                             "FlowFinishedEvent handler failed", exc_info=True
                         )
 
-                trace_listener = TraceCollectionListener()
+                from crewai.events.listeners.tracing.trace_listener import (
+                    get_trace_listener,
+                )
+
+                trace_listener = get_trace_listener()
                 if (
                     trace_listener.batch_manager.batch_owner_type == "flow"
                     and current_flow_id.get() == self.flow_id
@@ -2577,7 +2591,11 @@ class Flow(BaseModel, Generic[T], metaclass=FlowMeta):
                 except Exception:
                     logger.warning("FlowFailedEvent handler failed", exc_info=True)
 
-            trace_listener = TraceCollectionListener()
+            from crewai.events.listeners.tracing.trace_listener import (
+                get_trace_listener,
+            )
+
+            trace_listener = get_trace_listener()
             if (
                 trace_listener.batch_manager.batch_owner_type == "flow"
                 and current_flow_id.get() == self.flow_id
@@ -3123,8 +3141,21 @@ class Flow(BaseModel, Generic[T], metaclass=FlowMeta):
         trigger_method: FlowMethodName,
         subscription_key: PendingListenerKey,
     ) -> bool:
+        cached = self._condition_events_cache.get(subscription_key)
+        if cached is None:
+            cached = (
+                frozenset(_iter_condition_events(condition)),
+                _condition_satisfied(condition, set()),
+            )
+            self._condition_events_cache[subscription_key] = cached
+        condition_events, satisfied_without_events = cached
+        trigger = str(trigger_method)
+        if trigger not in condition_events:
+            # An event the condition never names cannot change its outcome.
+            return satisfied_without_events
+
         seen = self._pending_events.setdefault(subscription_key, set())
-        seen.add(str(trigger_method))
+        seen.add(trigger)
         if not _condition_satisfied(condition, seen):
             return False
         del self._pending_events[subscription_key]
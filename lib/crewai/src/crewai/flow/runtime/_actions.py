@@ -6,9 +6,11 @@ import ast
 import asyncio
 from collections.abc import Awaitable, Callable
 import contextvars
+from functools import lru_cache
 import inspect
 import os
 from pathlib import Path
+from types import CodeType
 from typing import TYPE_CHECKING, Any, Protocol, cast
 
 from crewai.flow.expressions import Expression, ExpressionData
@@ -244,26 +246,7 @@ class ScriptAction:
             )
 
         filename = f"crewai.flow.script.{self.flow._definition.name}"
-        module = ast.parse(self.definition.code, filename=filename)
-        function = ast.FunctionDef(
-            name="_flow_script",
-            args=ast.arguments(
-                posonlyargs=[],
-                args=[ast.arg(arg) for arg in ("state", "outputs", "input", "item")],
-                vararg=None,
-                kwonlyargs=[],
-                kw_defaults=[],
-                kwarg=None,
-                defaults=[],
-            ),
-            body=module.body or [ast.Pass()],
-            decorator_list=[],
-            returns=None,
-            type_comment=None,
-            type_params=[],
-        )
-        module.body = [function]
-        ast.fix_missing_locations(module)
+        code = _compile_script(self.definition.code, filename)
 
         # The YAML here is trusted project source authored by the code owner,
         # so this has the same trust boundary as using custom tools. We
@@ -271,10 +254,40 @@ class ScriptAction:
         # as function arguments. This is still arbitrary trusted Python execution,
         # so it remains disabled by default behind `CREWAI_ALLOW_FLOW_SCRIPT_EXECUTION`
         namespace: dict[str, Any] = {"__name__": filename}
-        exec(compile(module, filename, "exec"), namespace)  # nosec B102 # noqa: S102
+        exec(code, namespace)  # nosec B102 # noqa: S102
         return cast(Callable[..., Any], namespace["_flow_script"])
 
 
+@lru_cache(maxsize=256)
+def _compile_script(source: str, filename: str) -> CodeType:
+    """Compile a script body into a module defining ``_flow_script``.
+
+    Cached because every instance of a definition-built flow compiles the
+    same scripts; code objects are immutable, so sharing them is safe.
+    """
+    module = ast.parse(source, filename=filename)
+    function = ast.FunctionDef(
+        name="_flow_script",
+        args=ast.arguments(
+            posonlyargs=[],
+            args=[ast.arg(arg) for arg in ("state", "outputs", "input", "item")],
+            vararg=None,
+            kwonlyargs=[],
+            kw_defaults=[],
+            kwarg=None,
+            defaults=[],
+        ),
+        body=module.body or [ast.Pass()],
+        decorator_list=[],
+        returns=None,
+        type_comment=None,
+        type_params=[],
+    )
+    module.body = [function]
+    ast.fix_missing_locations(module)
+    return compile(module, filename, "exec")
+
+
 class EachAction:
     definition_type = FlowEachActionDefinition
 
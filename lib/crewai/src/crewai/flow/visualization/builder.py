@@ -3,6 +3,7 @@
 from __future__ import annotations
 
 from collections import defaultdict
+from collections.abc import Container, Iterator
 import logging
 from typing import TYPE_CHECKING, Any, cast
 
@@ -82,41 +83,58 @@ def _method_router_events(method_definition: FlowMethodDefinition) -> list[str]:
     return []
 
 
-def _extract_direct_or_triggers(
+def _collect_direct_or_triggers(
     condition: FlowDefinitionCondition,
-) -> list[str]:
+    strings: list[str],
+) -> None:
     if isinstance(condition, str):
-        return [condition]
+        strings.append(condition)
+        return
     condition_type, conditions = _definition_condition_parts(condition)
     if condition_type == AND_CONDITION:
-        return []
-    strings: list[str] = []
+        return
     for sub_condition in conditions:
-        strings.extend(_extract_direct_or_triggers(sub_condition))
-    return strings
+        _collect_direct_or_triggers(sub_condition, strings)
 
 
-def _extract_all_trigger_names(
+def _extract_direct_or_triggers(
     condition: FlowDefinitionCondition,
 ) -> list[str]:
+    strings: list[str] = []
+    _collect_direct_or_triggers(condition, strings)
+    return strings
+
+
+def _collect_all_trigger_names(
+    condition: FlowDefinitionCondition,
+    strings: list[str],
+) -> None:
     if isinstance(condition, str):
-        return [condition]
+        strings.append(condition)
+        return
     _, conditions = _definition_condition_parts(condition)
-    strings: list[str] = []
     for sub_condition in conditions:
-        strings.extend(_extract_all_trigger_names(sub_condition))
+        _collect_all_trigger_names(sub_condition, strings)
+
+
+def _extract_all_trigger_names(
+    condition: FlowDefinitionCondition,
+) -> list[str]:
+    strings: list[str] = []
+    _collect_all_trigger_names(condition, strings)
     return strings
 
 
 def _create_edges_from_condition(
     condition: FlowDefinitionCondition,
     target: str,
-    nodes: dict[str, NodeMetadata],
+    method_names: Container[str],
+    trigger_names: list[str] | None = None,
 ) -> list[StructureEdge]:
     edges: list[StructureEdge] = []
 
     if isinstance(condition, str):
-        if condition in nodes:
+        if condition in method_names:
             edges.append(
                 StructureEdge(
                     source=condition,
@@ -128,7 +146,11 @@ def _create_edges_from_condition(
     elif isinstance(condition, dict):
         cond_type, conditions = _definition_condition_parts(condition)
         if cond_type == AND_CONDITION:
-            triggers = _extract_all_trigger_names(condition)
+            triggers = (
+                trigger_names
+                if trigger_names is not None
+                else _extract_all_trigger_names(condition)
+            )
             edges.extend(
                 StructureEdge(
                     source=trigger,
@@ -137,11 +159,13 @@ def _create_edges_from_condition(
                     is_router_event=False,
                 )
                 for trigger in triggers
-                if trigger in nodes
+                if trigger in method_names
             )
         else:
             for sub_condition in conditions:
-                edges.extend(_create_edges_from_condition(sub_condition, target, nodes))
+                edges.extend(
+                    _create_edges_from_condition(sub_condition, target, method_names)
+                )
 
     return edges
 
@@ -175,9 +199,14 @@ def build_flow_structure(
     edges: list[StructureEdge] = []
     start_methods: list[str] = []
     router_methods: list[str] = []
+    listeners_by_trigger: defaultdict[str, list[str]] = defaultdict(list)
+    router_events_by_method: dict[str, list[str]] = {}
+    all_string_triggers: set[str] = set()
 
+    class_name = definition.name
+    method_names = definition.methods.keys()
     for method_name, method_definition in definition.methods.items():
-        node_metadata: NodeMetadata = {"type": "listen", "class_name": definition.name}
+        node_metadata: NodeMetadata = {"type": "listen", "class_name": class_name}
 
         if method_definition.is_start:
             node_metadata["type"] = "start"
@@ -188,10 +217,12 @@ def build_flow_structure(
             node_metadata["type"] = "router"
             router_methods.append(method_name)
             router_events = _method_router_events(method_definition)
+            router_events_by_method[method_name] = router_events
             if router_events:
                 node_metadata["router_events"] = router_events
 
         trigger_condition = _method_trigger_condition(method_definition)
+        extracted: list[str] | None = None
         condition_type = _condition_type_from_definition(trigger_condition)
         if condition_type is not None and trigger_condition is not None:
             node_metadata["trigger_condition_type"] = condition_type
@@ -208,35 +239,41 @@ def build_flow_structure(
 
         nodes[method_name] = node_metadata
 
-    for method_name, method_definition in definition.methods.items():
-        trigger_condition = _method_trigger_condition(method_definition)
-        if trigger_condition is None:
-            continue
-        edges.extend(
-            _create_edges_from_condition(trigger_condition, method_name, nodes)
-        )
-
-    all_string_triggers: set[str] = set()
-    for method_definition in definition.methods.values():
-        trigger_condition = _method_trigger_condition(method_definition)
-        if trigger_condition is None:
-            continue
-        for trigger in _extract_direct_or_triggers(trigger_condition):
-            if trigger not in nodes:
-                all_string_triggers.add(trigger)
+        if trigger_condition is not None:
+            edges.extend(
+                _create_edges_from_condition(
+                    trigger_condition, method_name, method_names, extracted
+                )
+            )
+            for trigger in dict.fromkeys(
+                _extract_direct_or_triggers(trigger_condition)
+            ):
+                listeners_by_trigger[trigger].append(method_name)
+                if trigger not in method_names:
+                    all_string_triggers.add(trigger)
 
     all_router_events: set[str] = set()
-    for router_method_name in router_methods:
-        router_events = _method_router_events(definition.methods[router_method_name])
-        if router_events and router_method_name in nodes:
-            nodes[router_method_name]["router_events"] = router_events
-            all_router_events.update(router_events)
-
+    for router_method_name, router_events in router_events_by_method.items():
         if not router_events:
             logger.warning(
                 f"Router events for '{router_method_name}' are dynamic or not "
                 f"statically inferable; static visualization may omit event edges."
             )
+            continue
+
+        all_router_events.update(router_events)
+        for event in router_events:
+            edges.extend(
+                StructureEdge(
+                    source=router_method_name,
+                    target=listener_name,
+                    condition_type=None,
+                    is_router_event=True,
+                    router_event=event,
+                )
+                for listener_name in listeners_by_trigger.get(event, ())
+                if listener_name != router_method_name
+            )
 
     orphaned_triggers = all_string_triggers - all_router_events
     if orphaned_triggers:
@@ -246,32 +283,6 @@ def build_flow_structure(
             f"Dynamic router values may still trigger these listeners at runtime."
         )
 
-    for router_method_name in router_methods:
-        router_events = _method_router_events(definition.methods[router_method_name])
-
-        for event in router_events:
-            for listener_name, method_definition in definition.methods.items():
-                if listener_name == router_method_name:
-                    continue
-
-                trigger_condition = _method_trigger_condition(method_definition)
-                if trigger_condition is None:
-                    continue
-                trigger_strings_from_cond = _extract_direct_or_triggers(
-                    trigger_condition
-                )
-
-                if str(event) in trigger_strings_from_cond:
-                    edges.append(
-                        StructureEdge(
-                            source=router_method_name,
-                            target=listener_name,
-                            condition_type=None,
-                            is_router_event=True,
-                            router_event=str(event),
-                        )
-                    )
-
     return FlowStructure(
         nodes=nodes,
         edges=edges,
@@ -289,55 +300,53 @@ def calculate_execution_paths(structure: FlowStructure) -> int:
     Returns:
         Number of possible execution paths.
     """
-    graph = defaultdict(list)
+    graph: defaultdict[str, list[str]] = defaultdict(list)
     for edge in structure["edges"]:
-        graph[edge["source"]].append(
-            {
-                "target": edge["target"],
-                "is_router": edge["is_router_event"],
-                "condition": edge["condition_type"],
-            }
-        )
+        graph[edge["source"]].append(str(edge["target"]))
 
-    all_nodes = set(structure["nodes"].keys())
-    nodes_with_outgoing = set(edge["source"] for edge in structure["edges"])
-    terminal_nodes = all_nodes - nodes_with_outgoing
+    terminal_nodes = structure["nodes"].keys() - graph.keys()
 
     if not structure["start_methods"] or not terminal_nodes:
         return 0
 
-    def count_paths_from(node: str, visited: set[str]) -> int:
-        if node in terminal_nodes:
-            return 1
-
-        if node in visited:
-            return 0
-
-        visited.add(node)
+    router_methods = set(structure["router_methods"])
 
-        outgoing = graph[node]
-        if not outgoing:
-            visited.remove(node)
+    def count_paths_from(start: str) -> int:
+        if start in terminal_nodes or not graph[start]:
             return 1
 
-        if node in structure["router_methods"]:
-            total = 0
-            for edge_info in outgoing:
-                target = str(edge_info["target"])
-                total += count_paths_from(target, visited.copy())
-            visited.remove(node)
-            return total
-
-        total = 0
-        for edge_info in outgoing:
-            target = str(edge_info["target"])
-            total += count_paths_from(target, visited.copy())
-
-        visited.remove(node)
-        return total if total > 0 else 1
+        # Iterative DFS: each frame is a node on the current path, its
+        # remaining outgoing edges and the path count gathered so far.
+        on_path: set[str] = {start}
+        stack: list[tuple[str, Iterator[str]]] = [(start, iter(graph[start]))]
+        totals: list[int] = [0]
+        while stack:
+            node, outgoing = stack[-1]
+            target = next(outgoing, None)
+            if target is not None:
+                if target in terminal_nodes:
+                    totals[-1] += 1
+                elif target not in on_path:
+                    if graph[target]:
+                        on_path.add(target)
+                        stack.append((target, iter(graph[target])))
+                        totals.append(0)
+                    else:
+                        totals[-1] += 1
+                continue
+
+            stack.pop()
+            on_path.remove(node)
+            total = totals.pop()
+            if total == 0 and node not in router_methods:
+                total = 1
+            if not totals:
+                return total
+            totals[-1] += total
+        return 0
 
     total_paths = 0
     for start in structure["start_methods"]:
-        total_paths += count_paths_from(start, set())
+        total_paths += count_paths_from(start)
 
     return max(total_paths, 1)
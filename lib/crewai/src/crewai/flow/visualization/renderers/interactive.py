@@ -1,5 +1,6 @@
 """Interactive HTML renderer for Flow structure visualization."""
 
+from collections import deque
 import json
 from pathlib import Path
 import tempfile
@@ -102,8 +103,9 @@ def calculate_node_positions(
     Returns:
         Dictionary mapping node names to their position data (level, x, y).
     """
-    children: dict[str, list[str]] = {name: [] for name in dag["nodes"]}
-    parents: dict[str, list[str]] = {name: [] for name in dag["nodes"]}
+    dag_nodes = dag["nodes"]
+    children: dict[str, list[str]] = {name: [] for name in dag_nodes}
+    parents: dict[str, list[str]] = {name: [] for name in dag_nodes}
 
     for edge in dag["edges"]:
         source = edge["source"]
@@ -113,16 +115,16 @@ def calculate_node_positions(
             parents[target].append(source)
 
     levels: dict[str, int] = {}
-    queue: list[tuple[str, int]] = []
+    queue: deque[tuple[str, int]] = deque()
 
     for start_method in dag["start_methods"]:
-        if start_method in dag["nodes"]:
+        if start_method in dag_nodes:
             levels[start_method] = 0
             queue.append((start_method, 0))
 
     visited: set[str] = set()
     while queue:
-        node, level = queue.pop(0)
+        node, level = queue.popleft()
         if node in visited:
             continue
         visited.add(node)
@@ -137,7 +139,7 @@ def calculate_node_positions(
                     levels[child] = child_level
                 queue.append((child, child_level))
 
-    for name in dag["nodes"]:
+    for name in dag_nodes:
         if name not in levels:
             levels[name] = 0
 
@@ -151,10 +153,6 @@ def calculate_node_positions(
     level_separation = 300  # Vertical spacing between levels
     node_spacing = 400  # Horizontal spacing between nodes
 
-    parent_count: dict[str, int] = {}
-    for node, parent_list in parents.items():
-        parent_count[node] = len(parent_list)
-
     for level, nodes_at_level in sorted(nodes_by_level.items()):
         y = level * level_separation
 
@@ -221,6 +219,8 @@ def render_interactive(
         Absolute path to generated HTML file in temporary directory.
     """
     node_positions = calculate_node_positions(dag)
+    # Pin x,y only for graphs with 3-4 nodes
+    pin_positions = 3 <= len(dag["nodes"]) <= 4
 
     nodes_list: list[dict[str, Any]] = []
     for name, metadata in dag["nodes"].items():
@@ -348,9 +348,7 @@ def render_interactive(
             "glowColor": None,
         }
 
-        # Add x,y only for graphs with 3-4 nodes
-        total_nodes = len(dag["nodes"])
-        if 3 <= total_nodes <= 4:
+        if pin_positions:
             node_data["x"] = position_data["x"]
             node_data["y"] = position_data["y"]
 
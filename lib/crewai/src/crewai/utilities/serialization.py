@@ -98,11 +98,10 @@ def to_serializable(
         }
     if isinstance(obj, BaseModel):
         try:
-            return to_serializable(
-                obj=obj.model_dump(mode="json", exclude=exclude, serialize_as_any=True),
+            return _limit_depth(
+                obj.model_dump(mode="json", exclude=exclude, serialize_as_any=True),
                 max_depth=max_depth,
                 _current_depth=_current_depth + 1,
-                _ancestors=new_ancestors,
             )
         except Exception:
             try:
@@ -121,6 +120,29 @@ def to_serializable(
     return repr(obj)
 
 
+def _limit_depth(obj: Any, max_depth: int, _current_depth: int) -> Serializable:
+    """Apply ``to_serializable``'s depth limit to JSON-mode ``model_dump`` output.
+
+    Pydantic has already converted every value to a JSON type and the dump is
+    a freshly built tree, so the type dispatch and cycle tracking of a second
+    ``to_serializable`` pass would only repeat work.
+    """
+    if max_depth > 0 and _current_depth >= max_depth:
+        return repr(obj)
+    if isinstance(obj, dict):
+        return {
+            _to_serializable_key(key): _limit_depth(
+                value, max_depth, _current_depth + 1
+            )
+            for key, value in obj.items()
+        }
+    if isinstance(obj, list):
+        return [_limit_depth(item, max_depth, _current_depth + 1) for item in obj]
+    if isinstance(obj, (str, int, float, bool, type(None))):
+        return obj
+    return to_serializable(obj, max_depth=max_depth, _current_depth=_current_depth)
+
+
 def _to_serializable_key(key: Any) -> str:
     if isinstance(key, (str, int)):
         return str(key)
@@ -1634,6 +1634,32 @@ def test_or_branch_does_not_leave_stale_and_state():
     assert fired == ["joined"]
 
 
+def test_unrelated_triggers_do_not_track_pending_state():
+    class PartialJoinFlow(Flow):
+        @start()
+        def begin(self):
+            pass
+
+        @listen(begin)
+        def a(self):
+            pass
+
+        @listen(a)
+        def b(self):
+            pass
+
+        @listen(and_(a, "never_emitted"))
+        def blocked(self):
+            pass
+
+    flow = PartialJoinFlow()
+    flow.kickoff()
+
+    # Only the listener that names "a" keeps a partial join; "begin" and "b"
+    # completions never touch listeners whose conditions don't reference them.
+    assert flow._pending_events == {"blocked": {"a"}}
+
+
 def test_and_branch_inside_or_does_not_race():
     execution_order = []
 
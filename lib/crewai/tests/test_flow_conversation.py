@@ -10,7 +10,11 @@ import pytest
 from pydantic import BaseModel
 
 from crewai.events.event_bus import crewai_event_bus
-from crewai.events.listeners.tracing.trace_listener import TraceCollectionListener
+from crewai.events.listeners.tracing.trace_listener import get_trace_listener
+from crewai.events.listeners.tracing.utils import (
+    reset_tracing_enabled,
+    set_tracing_enabled,
+)
 from crewai.events.types.flow_events import (
     ConversationMessageAddedEvent,
     ConversationRouteSelectedEvent,
@@ -1177,7 +1181,7 @@ class TestConversationalFlow:
         flow = DeferredFlow()
         flow.defer_trace_finalization = True
 
-        listener = TraceCollectionListener()
+        listener = get_trace_listener()
         with patch.object(listener.batch_manager, "finalize_batch") as mock_finalize:
             flow.handle_turn("turn 1")
             flow.handle_turn("turn 2")
@@ -1409,7 +1413,7 @@ class TestConversationalFlow:
         flow = DeferredFlow()
         flow.defer_trace_finalization = True
 
-        listener = TraceCollectionListener()
+        listener = get_trace_listener()
         listener.batch_manager.batch_owner_type = "flow"
         listener.first_time_handler.is_first_time = False
 
@@ -1497,7 +1501,7 @@ class TestConversationalFlow:
         flow = DeferredFlow()
         flow.defer_trace_finalization = True
 
-        listener = TraceCollectionListener()
+        listener = get_trace_listener()
         listener.batch_manager.batch_owner_type = "flow"
         listener.first_time_handler.is_first_time = False
 
@@ -1781,11 +1785,12 @@ class TestFlowTracingWhenSuppressed:
         assert finished == []
 
     def test_llm_action_inside_flow_claims_flow_trace_batch(self) -> None:
-        listener = TraceCollectionListener()
+        listener = get_trace_listener()
         listener.batch_manager.current_batch = None
         listener.batch_manager.batch_owner_type = None
         listener.batch_manager.batch_owner_id = None
 
+        tracing_token = set_tracing_enabled(True)
         flow_id_token = current_flow_id.set("flow-test-id")
         flow_name_token = current_flow_name.set("DemoSupportFlow")
         try:
@@ -1798,6 +1803,7 @@ class TestFlowTracingWhenSuppressed:
         finally:
             current_flow_id.reset(flow_id_token)
             current_flow_name.reset(flow_name_token)
+            reset_tracing_enabled(tracing_token)
 
         assert listener.batch_manager.batch_owner_type == "flow"
         assert listener.batch_manager.batch_owner_id == "flow-test-id"
@@ -1914,7 +1920,7 @@ class TestDeferredFlowLifecycleEvents:
                 return "worked"
 
         flow = DeferredFlow()
-        listener = TraceCollectionListener()
+        listener = get_trace_listener()
         listener.batch_manager.batch_owner_type = "flow"
         listener.first_time_handler.is_first_time = False
 
@@ -1940,7 +1946,7 @@ class TestDeferredFlowLifecycleEvents:
     def test_sigint_skips_deferred_session_batch(self) -> None:
         from crewai.events.listeners.tracing.trace_batch_manager import TraceBatch
 
-        listener = TraceCollectionListener()
+        listener = get_trace_listener()
         listener.batch_manager.current_batch = TraceBatch()
         listener.batch_manager.defer_session_finalization = True
 
@@ -1958,7 +1964,7 @@ class TestDeferredFlowLifecycleEvents:
             def begin(self) -> str:
                 return "done"
 
-        listener = TraceCollectionListener()
+        listener = get_trace_listener()
         listener.batch_manager.defer_session_finalization = False
 
         flow = DeferredTraceFlow()
@@ -1981,7 +1987,7 @@ class TestDeferredFlowLifecycleEvents:
             def begin(self) -> str:
                 return "done"
 
-        listener = TraceCollectionListener()
+        listener = get_trace_listener()
         listener.batch_manager.defer_session_finalization = True
 
         PlainTraceFlow().kickoff()
@@ -2004,12 +2010,10 @@ class TestNestedCrewTracing:
             current_flow_id.reset(token)
 
     def test_nested_crew_completion_skips_finalize(self) -> None:
-        from crewai.events.listeners.tracing.trace_listener import (
-            TraceCollectionListener,
-        )
+        from crewai.events.listeners.tracing.trace_listener import get_trace_listener
         from crewai.flow.flow_context import current_flow_id
 
-        listener = TraceCollectionListener()
+        listener = get_trace_listener()
         listener.batch_manager.batch_owner_type = "crew"
 
         token = current_flow_id.set("parent-flow-id")
@@ -2024,12 +2028,10 @@ class TestNestedCrewTracing:
             current_flow_id.reset(token)
 
     def test_flow_owned_batch_skips_finalize_without_flow_context(self) -> None:
-        from crewai.events.listeners.tracing.trace_listener import (
-            TraceCollectionListener,
-        )
+        from crewai.events.listeners.tracing.trace_listener import get_trace_listener
         from crewai.events.listeners.tracing.trace_batch_manager import TraceBatch
 
-        listener = TraceCollectionListener()
+        listener = get_trace_listener()
         listener.batch_manager.batch_owner_type = "flow"
         listener.batch_manager.current_batch = TraceBatch(
             execution_metadata={"execution_type": "flow", "flow_name": "Demo"},
@@ -2043,11 +2045,9 @@ class TestNestedCrewTracing:
             mock_finalize.assert_not_called()
 
     def test_lazy_flow_batch_from_context_preserves_deferred_parent(self) -> None:
-        from crewai.events.listeners.tracing.trace_listener import (
-            TraceCollectionListener,
-        )
+        from crewai.events.listeners.tracing.trace_listener import get_trace_listener
 
-        listener = TraceCollectionListener()
+        listener = get_trace_listener()
         listener.batch_manager.current_batch = None
         listener.batch_manager.batch_owner_type = None
         listener.batch_manager.batch_owner_id = None
@@ -2137,7 +2137,7 @@ class TestNestedCrewTracing:
                 )
                 return Crew(agents=[agent], tasks=[task], verbose=False).kickoff().raw
 
-        listener = TraceCollectionListener()
+        listener = get_trace_listener()
         listener.batch_manager.current_batch = None
         listener.batch_manager.batch_owner_type = None
         listener.batch_manager.batch_owner_id = None
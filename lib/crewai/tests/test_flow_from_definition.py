@@ -27,7 +27,10 @@ from crewai.flow.flow_config import flow_config
 from crewai.flow.flow_definition import FlowConfigDefinition, FlowDefinition
 from crewai.flow.persistence import persist
 from crewai.flow.persistence.base import FlowPersistence
-from crewai.flow.runtime._actions import FlowScriptExecutionDisabledError
+from crewai.flow.runtime._actions import (
+    FlowScriptExecutionDisabledError,
+    _compile_script,
+)
 from crewai.project.crew_definition import AgentDefinition
 from crewai.state.checkpoint_config import CheckpointConfig
 from crewai.tools import BaseTool
@@ -2369,6 +2372,36 @@ methods:
     assert flow.state["rounded"] == 4
 
 
+def test_script_action_compiles_once_per_definition(
+    monkeypatch: pytest.MonkeyPatch,
+):
+    monkeypatch.setenv("CREWAI_ALLOW_FLOW_SCRIPT_EXECUTION", "1")
+
+    yaml_str = """
+schema: crewai.flow/v1
+name: CachedScriptFlow
+methods:
+  count:
+    do:
+      call: script
+      code: |
+        global calls
+        calls = globals().get("calls", 0) + 1
+        return calls
+    start: true
+"""
+
+    _compile_script.cache_clear()
+    first = Flow.from_declaration(contents=yaml_str)
+    second = Flow.from_declaration(contents=yaml_str)
+
+    cache_info = _compile_script.cache_info()
+    assert cache_info.misses == 1
+    assert cache_info.hits == 1
+    assert first.kickoff() == 1
+    assert second.kickoff() == 1
+
+
 def test_script_listener_reads_trigger_input_and_outputs(
     monkeypatch: pytest.MonkeyPatch,
 ):
@@ -167,6 +167,53 @@ def test_build_flow_structure_from_flow_definition():
     )
 
 
+def test_build_flow_structure_extracts_triggers_once_per_method():
+    """Trigger names are extracted once per method, not once per router event."""
+    from unittest.mock import patch
+
+    from crewai.flow.visualization import builder
+
+    events = [f"event_{i}" for i in range(5)]
+    definition = FlowDefinition.from_declaration(contents=
+        {
+            "schema": "crewai.flow/v1",
+            "name": "FanOutFlow",
+            "methods": {
+                "begin": {
+                    "do": {"ref": "defined_flows:FanOutFlow.begin"},
+                    "start": True,
+                },
+                "decide": {
+                    "do": {"ref": "defined_flows:FanOutFlow.decide"},
+                    "listen": "begin",
+                    "router": True,
+                    "emit": events,
+                },
+                **{
+                    f"handle_{event}": {
+                        "do": {"ref": f"defined_flows:FanOutFlow.handle_{event}"},
+                        "listen": event,
+                    }
+                    for event in events
+                },
+            },
+        }
+    )
+
+    with patch.object(
+        builder,
+        "_extract_direct_or_triggers",
+        wraps=builder._extract_direct_or_triggers,
+    ) as extract:
+        structure = build_flow_structure(definition)
+
+    assert extract.call_count == len(events) + 1
+    router_edges = [edge for edge in structure["edges"] if edge["is_router_event"]]
+    assert sorted(edge["target"] for edge in router_edges) == sorted(
+        f"handle_{event}" for event in events
+    )
+
+
 def test_build_flow_structure_with_router():
     """Test building structure for a flow with router."""
     flow = RouterFlow()
@@ -374,6 +421,32 @@ def test_topological_path_counting():
     assert len(structure["edges"]) > 0
 
 
+def test_path_counting_handles_flows_deeper_than_recursion_limit():
+    """Path counting walks long chains without recursing per node."""
+    import sys
+
+    from crewai.flow.visualization import calculate_execution_paths
+
+    depth = sys.getrecursionlimit() + 100
+    names = [f"step_{i}" for i in range(depth)]
+    structure = {
+        "nodes": {name: {"type": "listen"} for name in names},
+        "edges": [
+            {
+                "source": source,
+                "target": target,
+                "condition_type": "OR",
+                "is_router_event": False,
+            }
+            for source, target in zip(names, names[1:])
+        ],
+        "start_methods": [names[0]],
+        "router_methods": [],
+    }
+
+    assert calculate_execution_paths(structure) == 1
+
+
 def test_class_metadata_comes_from_declaration():
     """Test that nodes include only definition-derived class metadata."""
     flow = SimpleFlow()
@@ -779,3 +779,56 @@ def test_per_guardrail_independent_retry_tracking():
     assert call_counts["g3"] == 1
 
     assert "G3(1)" in result.raw
+
+
+def test_guardrail_started_event_reads_function_source_once():
+    from crewai.events.types import llm_guardrail_events
+
+    def retry_guardrail(result: TaskOutput) -> tuple[bool, str]:
+        return (True, result.raw)
+
+    llm_guardrail_events._code_source.cache_clear()
+    with patch.object(
+        llm_guardrail_events, "getsource", wraps=llm_guardrail_events.getsource
+    ) as getsource:
+        events = [
+            LLMGuardrailStartedEvent(guardrail=retry_guardrail, retry_count=retry)
+            for retry in range(3)
+        ]
+
+    assert getsource.call_count == 1
+    assert {event.guardrail for event in events} == {
+        "def retry_guardrail(result: TaskOutput) -> tuple[bool, str]:\n"
+        "        return (True, result.raw)"
+    }
+    assert all(event.guardrail_name == "retry_guardrail" for event in events)
+
+
+def test_guardrail_source_cache_distinguishes_identical_code_in_other_files(
+    tmp_path,
+):
+    from crewai.events.types import llm_guardrail_events
+
+    guardrails = []
+    for name in ("first", "second"):
+        path = tmp_path / f"{name}_guardrail.py"
+        path.write_text(
+            f"def check(result):\n    return (True, result)  # {name}\n"
+        )
+        namespace: dict = {}
+        exec(compile(path.read_text(), str(path), "exec"), namespace)
+        guardrails.append(namespace["check"])
+
+    assert guardrails[0].__code__ == guardrails[1].__code__
+
+    llm_guardrail_events._code_source.cache_clear()
+    sources = [
+        LLMGuardrailStartedEvent(guardrail=guardrail, retry_count=0).guardrail
+        for guardrail in guardrails
+    ]
+
+    assert llm_guardrail_events._code_source.cache_info().misses == 2
+    assert sources == [
+        "def check(result):\n    return (True, result)  # first",
+        "def check(result):\n    return (True, result)  # second",
+    ]
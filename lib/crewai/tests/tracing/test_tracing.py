@@ -4,6 +4,7 @@ from unittest.mock import MagicMock, Mock, patch
 
 import pytest
 from crewai import Agent, Crew, Task
+from crewai.events.listeners.tracing import trace_listener as trace_listener_module
 from crewai.events.listeners.tracing.first_time_trace_handler import (
     FirstTimeTraceHandler,
 )
@@ -13,6 +14,7 @@ from crewai.events.listeners.tracing.trace_batch_manager import (
 )
 from crewai.events.listeners.tracing.trace_listener import (
     TraceCollectionListener,
+    get_trace_listener,
 )
 from crewai.events.listeners.tracing.types import TraceEvent
 from crewai.flow.flow import Flow, start
@@ -69,18 +71,8 @@ class TestTraceListenerSetup:
             crewai_event_bus._handler_dependencies = {}
             crewai_event_bus._execution_plan_cache = {}
 
-        # Reset TraceCollectionListener singleton - must reset instance attributes too
-        if TraceCollectionListener._instance is not None:
-            # Reset instance attributes that shadow class attributes (only if they exist as instance attrs)
-            instance_dict = TraceCollectionListener._instance.__dict__
-            if "_initialized" in instance_dict:
-                del TraceCollectionListener._instance._initialized
-            if "_listeners_setup" in instance_dict:
-                del TraceCollectionListener._instance._listeners_setup
-
-        TraceCollectionListener._instance = None
-        TraceCollectionListener._initialized = False
-        TraceCollectionListener._listeners_setup = False
+        # Drop the process-wide TraceCollectionListener so each test builds its own
+        trace_listener_module._trace_listener = None
 
         if hasattr(EventListener, "_instance"):
             EventListener._instance = None
@@ -93,18 +85,8 @@ class TestTraceListenerSetup:
             crewai_event_bus._handler_dependencies = {}
             crewai_event_bus._execution_plan_cache = {}
 
-        # Reset TraceCollectionListener singleton - must reset instance attributes too
-        if TraceCollectionListener._instance is not None:
-            # Reset instance attributes that shadow class attributes (only if they exist as instance attrs)
-            instance_dict = TraceCollectionListener._instance.__dict__
-            if "_initialized" in instance_dict:
-                del TraceCollectionListener._instance._initialized
-            if "_listeners_setup" in instance_dict:
-                del TraceCollectionListener._instance._listeners_setup
-
-        TraceCollectionListener._instance = None
-        TraceCollectionListener._initialized = False
-        TraceCollectionListener._listeners_setup = False
+        # Drop the process-wide TraceCollectionListener so each test builds its own
+        trace_listener_module._trace_listener = None
 
         if hasattr(EventListener, "_instance"):
             EventListener._instance = None
@@ -170,8 +152,7 @@ class TestTraceListenerSetup:
             )
             crew = Crew(agents=[agent], tasks=[task], verbose=True)
 
-            from crewai.events.listeners.tracing.trace_listener import TraceCollectionListener
-            trace_listener = TraceCollectionListener()
+            trace_listener = get_trace_listener()
 
             crew.kickoff()
 
@@ -275,7 +256,7 @@ class TestTraceListenerSetup:
 
             from crewai.events.event_bus import crewai_event_bus
 
-            trace_listener = TraceCollectionListener()
+            trace_listener = get_trace_listener()
             trace_listener.setup_listeners(crewai_event_bus)
 
             with patch.object(
@@ -431,8 +412,7 @@ class TestTraceListenerSetup:
             )
             crew = Crew(agents=[agent], tasks=[task], tracing=True)
 
-            from crewai.events.listeners.tracing.trace_listener import TraceCollectionListener
-            trace_listener = TraceCollectionListener()
+            trace_listener = get_trace_listener()
 
             crew.kickoff()
 
@@ -467,8 +447,7 @@ class TestTraceListenerSetup:
                 agent=agent,
             )
 
-            from crewai.events.listeners.tracing.trace_listener import TraceCollectionListener
-            trace_listener = TraceCollectionListener()
+            trace_listener = get_trace_listener()
 
             crew = Crew(agents=[agent], tasks=[task], tracing=True)
             crew.kickoff()
@@ -559,7 +538,7 @@ class TestTraceListenerSetup:
 
             from crewai.events.event_bus import crewai_event_bus
 
-            trace_listener = TraceCollectionListener()
+            trace_listener = get_trace_listener()
             trace_listener.setup_listeners(crewai_event_bus)
 
             trace_listener.first_time_handler = FirstTimeTraceHandler()
@@ -632,7 +611,7 @@ class TestTraceListenerSetup:
 
             from crewai.events.event_bus import crewai_event_bus
 
-            trace_listener = TraceCollectionListener()
+            trace_listener = get_trace_listener()
             trace_listener.setup_listeners(crewai_event_bus)
 
             # Re-initialize first-time handler after patches are applied to ensure clean state
@@ -743,7 +722,7 @@ class TestTraceListenerSetup:
                 crewai_event_bus._sync_handlers = {}
                 crewai_event_bus._async_handlers = {}
 
-            trace_listener = TraceCollectionListener()
+            trace_listener = get_trace_listener()
 
             # Re-initialize first-time handler after patches are applied to ensure clean state
             # This is necessary because the singleton may have been created before patches were active
@@ -1069,6 +1048,54 @@ class TestTraceListenerSetup:
                 payload = mock_init.call_args[0][0]
                 assert "user_identifier" not in payload
 
+    def test_get_trace_listener_returns_process_wide_instance(self):
+        from crewai.events.listeners.tracing.trace_listener import (
+            get_current_trace_listener,
+        )
+
+        assert get_current_trace_listener() is None
+
+        listener = get_trace_listener()
+
+        assert get_trace_listener() is listener
+        assert get_current_trace_listener() is listener
+
+    def test_formatter_defaults_to_event_listener_formatter(self):
+        from crewai.events.event_listener import EventListener
+
+        listener = get_trace_listener()
+        console = EventListener()
+
+        assert listener.formatter is console.formatter
+
+        explicit = MagicMock()
+        listener.formatter = explicit
+        assert listener.formatter is explicit
+
+    def test_user_context_reuses_session_and_mints_trace_id(self):
+        """Session identity is per process; every batch gets a fresh trace id."""
+        with patch.dict(os.environ, {"CREWAI_USER_ID": "user-1"}):
+            listener = get_trace_listener()
+
+        first = listener._get_user_context()
+        second = listener._get_user_context()
+
+        assert first["user_id"] == second["user_id"] == "user-1"
+        assert first["session_id"] == second["session_id"]
+        assert first["trace_id"] != second["trace_id"]
+
+    def test_authentication_check_is_cached(self):
+        listener = get_trace_listener()
+
+        with patch(
+            "crewai.events.listeners.tracing.trace_listener.get_auth_token",
+            return_value="mock_token_12345",
+        ) as mock_get_token:
+            assert listener._check_authenticated() is True
+            assert listener._check_authenticated() is True
+
+        mock_get_token.assert_called_once()
+
 
 class TestTraceBatchIdClearedOnFailure:
     """Tests: trace_batch_id is cleared when _initialize_backend_batch fails."""
@@ -1781,3 +1808,107 @@ class TestTraceBatchManagerDuplicateInitMerge:
         assert meta.get("execution_type") == "flow"
         assert meta.get("flow_name") == "ResearchFlow"
         assert meta.get("crew_name") == "Unknown Crew"
+
+
+class TestEventTableDispatch:
+    """Table-registered events reach the generic handler matching their kind."""
+
+    def test_events_are_forwarded_to_trace_or_action_handler(self):
+        from crewai.events.event_bus import crewai_event_bus
+        from crewai.events.types.flow_events import (
+            FlowPlotEvent,
+            MethodExecutionStartedEvent,
+        )
+
+        listener = TraceCollectionListener.__new__(TraceCollectionListener)
+        method_event = MethodExecutionStartedEvent(
+            flow_name="ExampleFlow", method_name="begin", state={}
+        )
+        plot_event = FlowPlotEvent(flow_name="ExampleFlow")
+
+        with (
+            crewai_event_bus.scoped_handlers(),
+            patch.object(TraceCollectionListener, "_handle_trace_event") as traced,
+            patch.object(TraceCollectionListener, "_handle_action_event") as actions,
+        ):
+            listener._register_flow_event_handlers(crewai_event_bus)
+            crewai_event_bus.emit(None, method_event)
+            crewai_event_bus.emit(None, plot_event)
+            crewai_event_bus.flush()
+
+        traced.assert_called_once_with("method_execution_started", None, method_event)
+        actions.assert_called_once_with("flow_plot", None, plot_event)
+
+    def test_events_are_dropped_when_run_is_not_traced(self):
+        from crewai.events.types.llm_events import LLMCallStartedEvent
+
+        listener = get_trace_listener()
+        listener.batch_manager.current_batch = None
+        listener.batch_manager.event_buffer = []
+        listener.first_time_handler.is_first_time = False
+        event = LLMCallStartedEvent(model="gpt-4o-mini", messages=[], call_id="c1")
+
+        with (
+            patch(
+                "crewai.events.listeners.tracing.trace_listener.is_tracing_enabled_in_context",
+                return_value=False,
+            ),
+            patch(
+                "crewai.events.listeners.tracing.trace_listener.is_tui_mode",
+                return_value=False,
+            ),
+            patch.object(listener, "_create_trace_event") as create_trace_event,
+        ):
+            listener._handle_action_event("llm_call_started", None, event)
+            listener._handle_trace_event("llm_call_started", None, event)
+
+        create_trace_event.assert_not_called()
+        assert listener.batch_manager.current_batch is None
+        assert listener.batch_manager.event_buffer == []
+
+
+class TestEventDataBuilders:
+    """Event data builders map trace payload fields off the event."""
+
+    def test_agent_execution_fields(self):
+        from types import SimpleNamespace
+
+        agent = SimpleNamespace(role="Researcher", goal="Find", backstory="Curious")
+        data = TraceCollectionListener._event_data_builders["agent_execution_started"](
+            SimpleNamespace(agent=agent), None
+        )
+
+        assert data == {
+            "agent_role": "Researcher",
+            "agent_goal": "Find",
+            "agent_backstory": "Curious",
+        }
+
+    def test_task_completed_without_task_or_output_yields_none(self):
+        from types import SimpleNamespace
+
+        data = TraceCollectionListener._event_data_builders["task_completed"](
+            SimpleNamespace(task=None, output=None), None
+        )
+
+        assert data == {
+            "task_description": None,
+            "task_name": None,
+            "task_id": None,
+            "output_raw": None,
+            "output_format": None,
+            "agent_role": None,
+        }
+
+
+class TestPendingEventProcessing:
+    def test_processing_counts_handler_until_exit_even_on_error(self):
+        bm = TraceBatchManager()
+
+        with pytest.raises(ValueError), bm.processing():
+            assert bm._pending_events_count == 1
+            assert bm.wait_for_pending_events(timeout=0.01) is False
+            raise ValueError("serialization failed")
+
+        assert bm._pending_events_count == 0
+        assert bm.wait_for_pending_events(timeout=0.01) is True
@@ -170,6 +170,26 @@ def test_depth_limit():
     }
 
 
+def test_depth_limit_applies_inside_pydantic_models():
+    person = Person(
+        name="John Doe",
+        age=30,
+        address=Address(street="123 Main St", city="Tech City", country="Pythonia"),
+        birthday=date(1994, 1, 1),
+        skills=["Python", "Testing"],
+    )
+
+    result = to_serializable(person, max_depth=3)
+
+    assert result["name"] == "John Doe"
+    assert result["skills"] == ["'Python'", "'Testing'"]
+    assert result["address"] == {
+        "street": "'123 Main St'",
+        "city": "'Tech City'",
+        "country": "'Pythonia'",
+    }
+
+
 @pytest.mark.parametrize("max_depth", [0, -1])
 def test_non_positive_max_depth_disables_depth_limit(max_depth):
     def create_nested(depth):